@@ -7,18 +7,61 @@ type of connector. ``Output`` connectors are used to send data and
 
 from __future__ import annotations
 
-from typing import Any, Optional, TYPE_CHECKING, Tuple
+import asyncio
+from collections import deque
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Callable, Deque, Dict, Iterable, List, NamedTuple, Optional, TYPE_CHECKING, Tuple
 
+import ray
 from ray.util.queue import Empty
-from ray.util.queue import Queue
+from ray.util.queue import Full
 
 from .exceptions import MissingConnectionError, OverwriteConnectionError
-from .utils import KillSignal, ObjectCollection
+from .queues import BatchQueue
+from .utils import KillSignal, ObjectCollection, UpstreamDoneSignal
 
 if TYPE_CHECKING:  # pragma: no cover
     from .nodes import AbstractNode
 
 
+class _StoredObject(NamedTuple):
+    """Reference to data written into the ray object store by an ``Output`` connector"""
+
+    ref: ray.ObjectRef
+
+
+@lru_cache(maxsize=None)
+def _build_put_factory(num_partners: int, zero_copy: bool) -> Callable:
+    """Compile a factory for ``Output.put`` implementations specialized to a fixed number of partners
+
+    Args:
+        num_partners: The number of connected partners
+        zero_copy: Whether data is routed through the ray object store
+
+    Returns:
+        A function that accepts the ``_put`` method of each partner and returns a ``put`` function
+    """
+
+    partner_args = ', '.join(f'_p{i}' for i in range(num_partners))
+    lines = [f'def factory({partner_args}):', '    def put(x, raise_missing_connection=True):']
+    if num_partners:
+        if zero_copy:
+            lines.append('        x = _StoredObject(ray.put(x))')
+
+        lines.extend(f'        _p{i}(x)' for i in range(num_partners))
+
+    else:
+        lines.append('        if raise_missing_connection:')
+        lines.append("            raise MissingConnectionError('Output connector is not connected to any input connectors.')")
+
+    lines.append('    return put')
+
+    namespace = {'ray': ray, '_StoredObject': _StoredObject, 'MissingConnectionError': MissingConnectionError}
+    exec(compile('\n'.join(lines), '<egon-gen>', 'exec'), namespace)
+    return namespace['factory']
+
+
 class BaseConnector:
     """Adds signal/slot style functionality to an underlying ``Queue`` object"""
 
@@ -29,9 +72,29 @@ class BaseConnector:
             name: Optional human readable name for the connector object
         """
 
+        self._id = hex(id(self))
         self.name = str(id(self)) if name is None else name
         self._node: Optional[AbstractNode] = None  # This is the node that this connector is assigned to
         self._connected_partners = ObjectCollection()  # This tracks other connectors that connect to this instance
+        self._partners_tuple: Tuple[BaseConnector, ...] = ()  # Cached snapshot of ``_connected_partners``
+
+    @property
+    def name(self) -> str:
+        """Human readable name for the connector object"""
+
+        return self._name
+
+    @name.setter
+    def name(self, name: str) -> None:
+        # Cache the string representation since it depends on the name
+        self._name = name
+        self._str = f'<{self.__class__.__name__}(name={name}) object at {self._id}>'
+
+    def __setstate__(self, state: Dict) -> None:
+        # Unpickled copies (e.g., in node processes) have a new address
+        self.__dict__.update(state)
+        self._id = hex(id(self))
+        self.name = self._name
 
     @property
     def parent_node(self) -> AbstractNode:
@@ -43,36 +106,70 @@ class BaseConnector:
     def partners(self) -> Tuple:
         """Return a tuple of connectors that are connected to this instance"""
 
-        return tuple(self._connected_partners)
+        return self._partners_tuple
+
+    def _refresh_partners(self) -> None:
+        """Rebuild the cached tuple of connected partners"""
+
+        self._partners_tuple = tuple(self._connected_partners)
 
     def is_connected(self) -> bool:
         """Return whether the connector has any established connections"""
 
-        return bool(self._connected_partners)
+        return bool(self._partners_tuple)
 
-    def __str__(self) -> str:  # pragma: no cover
-        return f'<{self.__class__.__name__}(name={self.name}) object at {hex(id(self))}>'
+    def __str__(self) -> str:
+        return self._str
 
 
 class Input(BaseConnector):
     """Handles the input of data into a pipeline node"""
 
-    def __init__(self, name: str = None, maxsize: int = 0) -> None:
+    def __init__(
+            self,
+            name: str = None,
+            maxsize: int = 0,
+            actor_options: Optional[Dict] = None,
+            prefetch: int = 32,
+            refresh_interval: float = 2
+    ) -> None:
         """Handles the input of data into a pipeline node
 
         Args:
             name: Optional human readable name for the connector object
             maxsize: The maximum number of communicated items to store in memory
+            actor_options: Optional resource/scheduling options for the actor backing the underlying queue
+            prefetch: The maximum number of pending items to retrieve from the queue in a single call
+            refresh_interval: Default number of seconds between checks for data expected from upstream
         """
 
+        if not prefetch > 0:
+            raise ValueError('Connector prefetch size must be greater than zero.')
+
         super().__init__(name=name)
         self._maxsize = maxsize
-        self._queue = Queue(maxsize=maxsize)
+        self._actor_options = actor_options
+        self._prefetch = prefetch
+        self.refresh_interval = refresh_interval
+        self._buffer: Deque = deque()  # Items retrieved from the queue but not yet returned by ``get``
+        self._refill_lock: Optional[Tuple[asyncio.AbstractEventLoop, asyncio.Lock]] = None  # See ``_get_refill_lock``
+        self._queue = BatchQueue(maxsize=maxsize, actor_options=actor_options)
+
+    def __getstate__(self) -> Dict:
+        # Event loop primitives cannot be shared with other processes
+        state = self.__dict__.copy()
+        state['_refill_lock'] = None
+        return state
 
     def is_empty(self) -> bool:
         """Return if the connection queue is empty"""
 
-        return self._queue.empty()
+        return not self._buffer and self._queue.empty()
+
+    async def is_empty_async(self) -> bool:
+        """Coroutine version of ``is_empty``"""
+
+        return not self._buffer and await self._queue.empty_async()
 
     def is_full(self) -> bool:
         """Return if the connection queue is full"""
@@ -80,16 +177,21 @@ class Input(BaseConnector):
         return self._queue.full()
 
     def size(self) -> int:
-        """Return the size of the connection queue"""
+        """Return the size of the connection queue
+
+        The returned size is approximate when other processes are actively
+        adding or retrieving data from the connector.
+        """
 
-        return self._queue.qsize()
+        return len(self._buffer) + self._queue.qsize()
 
     @property
     def maxsize(self) -> int:
         """The maximum number of objects to store in the connector's memory
 
         Once the maximum size is reached, the ``put`` method will block until
-        an item is moved from the connector into the node.
+        an item is moved from the connector into the node. Items prefetched
+        by a node process do not count towards the maximum size.
         """
 
         return self._queue.maxsize
@@ -102,33 +204,231 @@ class Input(BaseConnector):
         if not self.is_empty():
             raise RuntimeError('Cannot change maximum connector size when the connector is not empty.')
 
-        self._queue = Queue(maxsize=maxsize)
+        self._queue.shutdown()
+        self._queue = BatchQueue(maxsize=maxsize, actor_options=self._actor_options)
+
+    @property
+    def refresh_interval(self) -> float:
+        """Default maximum number of seconds between checks for data expected from upstream"""
+
+        return self._refresh_interval
+
+    @refresh_interval.setter
+    def refresh_interval(self, refresh_interval: float) -> None:
+        if not refresh_interval > 0:
+            raise ValueError('Connector refresh interval must be greater than zero.')
+
+        self._refresh_interval = refresh_interval
+
+    def _put(self, x: Any) -> None:
+        """Add a single item into the underlying queue"""
+
+        self._queue.put(x)
+
+    async def _put_async(self, x: Any) -> None:
+        """Coroutine version of ``_put``"""
+
+        await self._queue.put_async(x)
+
+    def _put_batch(self, items: List) -> None:
+        """Add multiple items into the underlying queue using a single queue operation
+
+        Falls back to adding items individually if the batch does not fit
+        within the maximum queue size.
+        """
+
+        try:
+            self._queue.put_nowait_batch(items)
+
+        except Full:
+            for x in items:
+                self._queue.put(x)
+
+    def _get_from_queue(self, timeout: float) -> Any:
+        """Return the next item from the underlying queue
+
+        Pending items are prefetched into a local buffer so that multiple
+        items can be retrieved with a single remote call.
+
+        Raises:
+            Empty: If no items are retrieved within the given timeout
+        """
+
+        if not self._buffer:
+            num_consumers = self.parent_node.num_workers if self.parent_node else 1
+            self._buffer.extend(self._queue.get_batch(self._prefetch, num_consumers, timeout=timeout))
+
+        return self._buffer.popleft()
+
+    def _restore_buffer(self) -> None:
+        """Return any prefetched items that were not read back to the front of the underlying queue"""
+
+        if self._buffer:
+            self._queue.restore_batch(list(self._buffer))
+            self._buffer.clear()
+
+    def _get_refill_lock(self) -> asyncio.Lock:
+        """Return the lock guarding refills of the prefetch buffer within the running event loop"""
+
+        loop = asyncio.get_running_loop()
+        if self._refill_lock is None or self._refill_lock[0] is not loop:
+            self._refill_lock = (loop, asyncio.Lock())
+
+        return self._refill_lock[1]
+
+    async def _get_from_queue_async(self, timeout: float) -> Any:
+        """Coroutine version of ``_get_from_queue``
+
+        Coroutines in the same process share the prefetch buffer. Only one
+        refill is allowed at a time so buffered items stay in queue order.
+        """
+
+        if self._buffer:
+            return self._buffer.popleft()
+
+        lock = self._get_refill_lock()
+        try:
+            await asyncio.wait_for(lock.acquire(), timeout)
+
+        except asyncio.TimeoutError:
+            raise Empty
+
+        try:
+            if not self._buffer:
+                num_consumers = self.parent_node.num_workers if self.parent_node else 1
+                self._buffer.extend(await self._queue.get_batch_async(self._prefetch, num_consumers, timeout=timeout))
+
+            return self._buffer.popleft()
+
+        finally:
+            lock.release()
+
+    def _resolve(self, data: Any) -> Any:
+        """Return the value communicated by an item retrieved from the underlying queue"""
+
+        # Signals are only retrieved once the queue is empty
+        if data is UpstreamDoneSignal:
+            return KillSignal
+
+        if type(data) is _StoredObject:
+            return ray.get(data.ref)
+
+        return data
+
+    async def _resolve_async(self, data: Any) -> Any:
+        """Coroutine version of ``_resolve``"""
+
+        if data is UpstreamDoneSignal:
+            return KillSignal
+
+        if type(data) is _StoredObject:
+            return await data.ref
+
+        return data
+
+    def _notify_upstream_done(self) -> None:
+        """Wake any processes of the parent node waiting on data from upstream
+
+        Called once all upstream nodes have exited. One signal is queued
+        behind any pending data for each worker of the parent node. Signals
+        are not counted towards the size of the connector.
+        """
+
+        num_workers = self.parent_node.num_workers if self.parent_node else 1
+        self._queue.add_signals(num_workers)
+
+    def _clear_upstream_done(self) -> None:
+        """Discard any signals left over from a previous pipeline run"""
+
+        self._queue.clear_signals()
+
+    def close(self) -> None:
+        """Shut down the underlying queue and release its resources
 
-    def get(self, timeout: Optional[int] = None, refresh_interval: int = 2):
+        The connector cannot be used to communicate data once closed.
+        """
+
+        if self._queue.actor is not None:
+            self._queue.shutdown()
+
+    def get(self, timeout: Optional[int] = None, refresh_interval: Optional[float] = None):
         """Blocking call to retrieve input data
 
         Releases automatically when no more data is coming from upstream
 
         Args:
             timeout: Raise a TimeoutError if data is not retrieved within the given number of seconds
-            refresh_interval: How often to check if data is expected from upstream
+            refresh_interval: Maximum number of seconds between checks for data expected from upstream
+                (Defaults to the ``refresh_interval`` attribute)
 
         Raises:
             TimeOutError: Raised if the get call times out
         """
 
-        if not refresh_interval > 0:
+        if refresh_interval is None:
+            refresh_interval = self._refresh_interval
+
+        elif not refresh_interval > 0:
+            raise ValueError('Connector refresh interval must be greater than zero.')
+
+        return self._get_unchecked(timeout, refresh_interval)
+
+    def _get_unchecked(self, timeout: Optional[float], refresh_interval: float):
+        """Implementation of ``get`` without any validation of the arguments"""
+
+        node, buffer = self._node, self._buffer
+        if not timeout:
+            while True:
+                # Prefetched data is always returned without checking on upstream nodes
+                if not buffer and node and not node.is_expecting_data():
+                    return KillSignal
+
+                try:
+                    return self._resolve(self._get_from_queue(timeout=refresh_interval))
+
+                except Empty:
+                    continue
+
+        while timeout > 0:
+            if not buffer and node and not node.is_expecting_data():
+                return KillSignal
+
+            try:
+                return self._resolve(self._get_from_queue(timeout=min(timeout, refresh_interval)))
+
+            except Empty:
+                timeout -= refresh_interval
+
+        raise TimeoutError
+
+    async def get_async(self, timeout: Optional[int] = None, refresh_interval: Optional[float] = None):
+        """Coroutine version of ``get``
+
+        Args:
+            timeout: Raise a TimeoutError if data is not retrieved within the given number of seconds
+            refresh_interval: Maximum number of seconds between checks for data expected from upstream
+                (Defaults to the ``refresh_interval`` attribute)
+
+        Raises:
+            TimeOutError: Raised if the get call times out
+        """
+
+        if refresh_interval is None:
+            refresh_interval = self._refresh_interval
+
+        elif not refresh_interval > 0:
             raise ValueError('Connector refresh interval must be greater than zero.')
 
+        node, buffer = self._node, self._buffer
         timeout = timeout or float('inf')
         while timeout > 0:
-            if self.parent_node and not self.parent_node.is_expecting_data():
+            if not buffer and node and not await node.is_expecting_data_async():
                 return KillSignal
 
             try:
-                return self._queue.get(timeout=min(timeout, refresh_interval))
+                return await self._resolve_async(await self._get_from_queue_async(timeout=min(timeout, refresh_interval)))
 
-            except (Empty, TimeoutError):
+            except Empty:
                 timeout -= refresh_interval
 
         raise TimeoutError
@@ -142,26 +442,49 @@ class Input(BaseConnector):
         if self.parent_node is None:
             raise MissingConnectionError('Cannot use ``iter_get`` for an ``Input`` not assigned to a parent node.')
 
-        while self.parent_node.is_expecting_data():
-            data = self.get()
-            if data is KillSignal:
-                return
+        # ``get`` returns a kill signal once no more data is expected from upstream
+        get, refresh_interval = self._get_unchecked, self._refresh_interval
+        data = get(None, refresh_interval)
+        while data is not KillSignal:
+            yield data
+            data = get(None, refresh_interval)
+
+    async def iter_get_async(self) -> Any:
+        """Asynchronous iterator that returns input data
 
+        Automatically exits once no more data is expected from upstream nodes.
+        """
+
+        if self.parent_node is None:
+            raise MissingConnectionError('Cannot use ``iter_get_async`` for an ``Input`` not assigned to a parent node.')
+
+        get = self.get_async
+        data = await get()
+        while data is not KillSignal:
             yield data
+            data = await get()
 
 
 class Output(BaseConnector):
     """Handles the output of data from a pipeline node"""
 
-    def __init__(self, name: str = None) -> None:
+    def __init__(self, name: str = None, zero_copy: bool = False) -> None:
         """Handles the output of data from a pipeline node
 
+        When ``zero_copy`` is enabled, data is serialized once into the ray
+        object store and only a reference is sent to each connected input.
+        Large buffers (e.g., NumPy arrays) are then read by downstream nodes
+        without being copied. Custom data types benefit by exposing their
+        buffers to pickle protocol 5 via ``__reduce_ex__``.
+
         Args:
             name: Optional human readable name for the connector object
+            zero_copy: Send data to connected inputs through the ray object store
         """
 
         super().__init__(name=name)
         self._partner: Optional[Input] = None  # The connector object of another node
+        self._zero_copy = zero_copy
 
     def connect(self, connector: Input) -> None:
         """Establish the flow of data between this connector and another connector
@@ -179,6 +502,9 @@ class Output(BaseConnector):
         # Once a connection is established between two connectors, they share an internal queue
         self._connected_partners.add(connector)
         connector._connected_partners.add(self)
+        self._refresh_partners()
+        connector._refresh_partners()
+        self._unfinalize()
 
     def disconnect(self, connector: Input) -> None:
         """Disconnect any established connections"""
@@ -188,6 +514,24 @@ class Output(BaseConnector):
 
         connector._connected_partners.remove(self)
         self._connected_partners.remove(connector)
+        connector._refresh_partners()
+        self._refresh_partners()
+        self._unfinalize()
+
+    def finalize(self) -> None:
+        """Replace the ``put`` method with an implementation specialized for the current connections
+
+        This is called automatically by the parent pipeline before it is run.
+        Any subsequent change to the connections restores the generic method.
+        """
+
+        factory = _build_put_factory(len(self._partners_tuple), self._zero_copy)
+        self.put = factory(*(partner._put for partner in self._partners_tuple))
+
+    def _unfinalize(self) -> None:
+        """Restore the generic ``put`` method replaced by ``finalize``"""
+
+        self.__dict__.pop('put', None)
 
     def put(self, x: Any, raise_missing_connection: bool = True) -> None:
         """Add data into the connector
@@ -200,8 +544,71 @@ class Output(BaseConnector):
             MissingConnectionError: If trying to put data into an output that isn't connected to an input
         """
 
-        if not self.is_connected() and raise_missing_connection:
+        if self._zero_copy:
+            x = _StoredObject(ray.put(x))
+
+        partners = self._partners_tuple
+        if len(partners) == 1:
+            partners[0]._put(x)
+            return
+
+        if not partners and raise_missing_connection:
             raise MissingConnectionError('Output connector is not connected to any input connectors.')
 
-        for partner in self.partners:
-            partner._queue.put(x)
+        for partner in partners:
+            partner._put(x)
+
+    async def put_async(self, x: Any, raise_missing_connection: bool = True) -> None:
+        """Coroutine version of ``put``
+
+        Args:
+            x: The value to put into the connector
+            raise_missing_connection: Raise an error if trying to put data into an unconnected output
+
+        Raises:
+            MissingConnectionError: If trying to put data into an output that isn't connected to an input
+        """
+
+        if self._zero_copy:
+            x = _StoredObject(ray.put(x))
+
+        partners = self._partners_tuple
+        if not partners and raise_missing_connection:
+            raise MissingConnectionError('Output connector is not connected to any input connectors.')
+
+        await asyncio.gather(*(partner._put_async(x) for partner in partners))
+
+    def put_many(self, items: Iterable, batch_size: int = 32, raise_missing_connection: bool = True) -> None:
+        """Add multiple items into the connector
+
+        Items are sent to connected inputs in batches, reducing the number of
+        queue operations needed to communicate a large number of items. Items
+        are not sent until a full batch is collected (or ``items`` is exhausted),
+        so ``put`` should be preferred for slow or streaming data sources.
+
+        Args:
+            items: The values to put into the connector
+            batch_size: The maximum number of values to send in a single queue operation
+            raise_missing_connection: Raise an error if trying to put data into an unconnected output
+
+        Raises:
+            MissingConnectionError: If trying to put data into an output that isn't connected to an input
+        """
+
+        if not batch_size > 0:
+            raise ValueError('Connector batch size must be greater than zero.')
+
+        items = iter(items)
+        if self._zero_copy:
+            items = (_StoredObject(ray.put(x)) for x in items)
+
+        partners = self._partners_tuple
+        batch = list(islice(items, batch_size))
+        if batch and not partners and raise_missing_connection:
+            raise MissingConnectionError('Output connector is not connected to any input connectors.')
+
+        while batch:
+            for partner in partners:
+                partner._put_batch(batch)
+
+            batch = list(islice(items, batch_size))
@@ -40,8 +40,9 @@ class WrappedSource(nodes.Source):
     def action(self) -> None:
         """Call the wrapped generator and load results into the ``output`` connector"""
 
+        put = self.output.put
         for x in self._func():
-            self.output.put(x)
+            put(x)
 
     def __repr__(self) -> str:  # pragma: no cover
         return f'<WrappedSource(wrapped_function={self._func.__name__}) object at {hex(id(self))}>'
@@ -58,8 +59,9 @@ class WrappedTarget(nodes.Target):
     def action(self) -> None:
         """Call the wrapped function using data from the ``input`` connector"""
 
+        func = self._func
         for data in self.input.iter_get():
-            self._func(data)
+            func(data)
 
     def __repr__(self) -> str:  # pragma: no cover
         return f'<WrappedTarget(wrapped_function={self._func.__name__}) object at {hex(id(self))}>'
@@ -77,8 +79,9 @@ class WrappedNode(nodes.Node):
     def action(self) -> None:
         """Call the wrapped function and put it's return in the ``output`` connector."""
 
+        func, put = self._func, self.output.put
         for data in self.input.iter_get():
-            self.output.put(self._func(data))
+            put(func(data))
 
     def __repr__(self) -> str:  # pragma: no cover
         return f'<WrappedNode(wrapped_function={self._func.__name__}) object at {hex(id(self))}>'
@@ -62,8 +62,7 @@ class MockSource(Mock, nodes.Source):
     def action(self) -> None:
         """Placeholder function to satisfy requirements of abstract parent"""
 
-        for x in self.load_data:
-            self.output.put(x)
+        self.output.put_many(self.load_data)
 
 
 class MockTarget(Mock, nodes.Target):
@@ -1,18 +1,20 @@
 """The ``nodes`` module supports the construction of individual pipeline nodes.
 ``Source``, ``Node``,  and ``Target`` classes are provided for creating nodes
-that produce, analyze, and consume data respectively.
+that produce, analyze, and consume data respectively. The ``AsyncNode``
+class supports running multiple concurrent coroutine workers per process.
 """
 
 from __future__ import annotations
 
 import abc
+import asyncio
 from abc import ABC
 from itertools import chain
 from typing import Collection
-from typing import List, Tuple, Union
+from typing import List, Optional, Set, Tuple, Union
 
 from . import connectors, exceptions
-from .parallel import MPool
+from .parallel import MPool, cpu_affinity
 
 
 def _get_nodes_from_connectors(connector_list: Collection[connectors.BaseConnector]) -> Tuple:
@@ -37,6 +39,7 @@ class AbstractNode(abc.ABC):
         self._pool: MPool = MPool(num_processes, self.execute)
         self._allow_pool_overwrite = True  # See setter for ``num_processes`` attribute
         self.name = name or self.__class__.__name__
+        self.cpu_affinity: Optional[Set[int]] = None  # CPUs to pin node processes to while executing
 
         # Accumulate all attributes that are Input or Output types
         self._inputs = []
@@ -88,6 +91,12 @@ class AbstractNode(abc.ABC):
 
         self._pool = MPool(val, self.execute)
 
+    @property
+    def num_workers(self) -> int:
+        """The total number of workers concurrently executing the node's ``action``"""
+
+        return self.num_processes
+
     @property
     def connectors(self) -> Tuple[Tuple[connectors.Input, ...], Tuple[connectors.Output, ...]]:
         """Return tuples with all input and output connectors associated with the node
@@ -144,12 +153,27 @@ class AbstractNode(abc.ABC):
         """Execute the pipeline node
 
         Execution includes all ``setup``, ``action``, and ``teardown`` tasks.
+        If a ``cpu_affinity`` is set, the executing process is pinned to the
+        given CPUs for the duration of the execution. Any data prefetched by
+        the node's input connectors but not yet read is returned to the
+        connector queues when execution ends.
         """
 
         self._allow_pool_overwrite = False
-        self.setup()
+        with cpu_affinity(self.cpu_affinity):
+            try:
+                self.setup()
+                self._run_action()
+                self.teardown()
+
+            finally:
+                for connector in self._inputs:
+                    connector._restore_buffer()
+
+    def _run_action(self) -> None:
+        """Run the node's ``action`` as part of ``execute``"""
+
         self.action()
-        self.teardown()
 
     def is_running(self) -> bool:
         """Return if any node processes are still processing data"""
@@ -163,7 +187,7 @@ class AbstractNode(abc.ABC):
         running or any data is pending in the queue of an input connector.
         """
 
-        for input_connector in self._get_attrs(connectors.Input):
+        for input_connector in self._inputs:
             # IMPORTANT: The order of the following code blocks is crucial
             # We check for any running upstream nodes first
             for output_connector in input_connector.partners:
@@ -177,6 +201,25 @@ class AbstractNode(abc.ABC):
 
         return False
 
+    async def is_running_async(self) -> bool:
+        """Coroutine version of ``is_running``"""
+
+        return await asyncio.get_running_loop().run_in_executor(None, self.is_running)
+
+    async def is_expecting_data_async(self) -> bool:
+        """Coroutine version of ``is_expecting_data``"""
+
+        for input_connector in self._inputs:
+            # See ``is_expecting_data`` for why the order of these checks matters
+            for output_connector in input_connector.partners:
+                if await output_connector.parent_node.is_running_async():
+                    return True
+
+            if not await input_connector.is_empty_async():
+                return True
+
+        return False
+
     def __str__(self) -> str:  # pragma: no cover
         return f'<{self.__repr__()} object at {hex(id(self))}>'
 
@@ -239,3 +282,48 @@ class Node(AbstractNode, ABC):
             raise exceptions.OrphanedNodeError('Node has no associated connectors and is inaccessible by the pipeline.')
 
         self._validate_connections()
+
+
+class AsyncNode(Node, ABC):
+    """A pipeline node that runs multiple concurrent ``action`` coroutines in each process
+
+    Coroutine nodes are well suited to I/O bound tasks since a single process
+    can multiplex many concurrent workers. Data should be retrieved and sent
+    using the coroutine methods of each connector (e.g., ``iter_get_async``
+    and ``put_async``) so that workers do not block one another.
+    """
+
+    def __init__(self, name: str = None, num_processes: int = 1, num_coroutines: int = 1) -> None:
+        """Represents a single pipeline node
+
+        Args:
+            name: Optional human readable name for the node
+            num_processes: The number of processes to allocate to the node
+            num_coroutines: The number of concurrent ``action`` coroutines to run in each process
+        """
+
+        if num_coroutines <= 0:
+            raise ValueError(f'Cannot run less than one coroutine per process (got {num_coroutines}).')
+
+        super().__init__(name=name, num_processes=num_processes)
+        self.num_coroutines = num_coroutines
+
+    @property
+    def num_workers(self) -> int:
+        """The total number of workers concurrently executing the node's ``action``"""
+
+        return self.num_processes * self.num_coroutines
+
+    @abc.abstractmethod
+    async def action(self) -> None:
+        """The primary analysis task performed by this node"""
+
+    async def _gather_actions(self) -> None:
+        """Run ``num_coroutines`` concurrent calls to ``action``"""
+
+        await asyncio.gather(*(self.action() for _ in range(self.num_coroutines)))
+
+    def _run_action(self) -> None:
+        """Run the node's ``action`` coroutines concurrently in a new event loop"""
+
+        asyncio.run(self._gather_actions())
@@ -2,13 +2,75 @@
 
 from __future__ import annotations
 
+import os
+from contextlib import contextmanager
 from time import sleep
-from typing import List, Optional
+from typing import Collection, Iterator, List, Optional
 
 import ray
 from ray import ObjectRef
 
 
+def cpus_by_cache() -> List[int]:
+    """Return the CPUs available to the current process
+
+    CPUs are ordered so that CPUs sharing an L3 cache are adjacent to
+    one another. Cache topology is only detected on Linux.
+
+    Returns:
+        A list of CPU indices
+    """
+
+    if hasattr(os, 'sched_getaffinity'):
+        cpus = sorted(os.sched_getaffinity(0))
+
+    else:  # pragma: no cover
+        cpus = list(range(os.cpu_count() or 1))
+
+    groups = dict()
+    for cpu in cpus:
+        try:
+            with open(f'/sys/devices/system/cpu/cpu{cpu}/cache/index3/shared_cpu_list') as infile:
+                cache_id = infile.read().strip()
+
+        except OSError:
+            cache_id = None
+
+        groups.setdefault(cache_id, []).append(cpu)
+
+    return [cpu for group in groups.values() for cpu in group]
+
+
+@contextmanager
+def cpu_affinity(cpus: Optional[Collection[int]]) -> Iterator[None]:
+    """Context manager for temporarily restricting the current process to the given CPUs
+
+    The affinity is left unchanged if ``cpus`` is empty, if none of the
+    given CPUs are available to the current process, or if the platform
+    does not support setting CPU affinities.
+
+    Args:
+        cpus: Indices of the CPUs to run on
+    """
+
+    if not (cpus and hasattr(os, 'sched_setaffinity')):
+        yield
+        return
+
+    original_cpus = os.sched_getaffinity(0)
+    allowed_cpus = original_cpus.intersection(cpus)
+    if not allowed_cpus:
+        yield
+        return
+
+    os.sched_setaffinity(0, allowed_cpus)
+    try:
+        yield
+
+    finally:
+        os.sched_setaffinity(0, original_cpus)
+
+
 class Actor:
     """Worker object responsible for executing tasks a remote machine"""
 
@@ -30,6 +92,19 @@ class Actor:
 
         return self._act.remote(self)
 
+    def act_many(self, num_calls: int) -> List[ObjectRef]:
+        """Run the actor remotely multiple times
+
+        The actor is serialized into the object store once and shared by all
+        remote calls.
+
+        Args:
+            num_calls: The number of remote calls to make
+        """
+
+        actor_ref = ray.put(self)
+        return [self._act.remote(actor_ref) for _ in range(num_calls)]
+
 
 class MPool:
     """A pool of processes assigned to a single target function"""
@@ -48,6 +123,7 @@ class MPool:
         self._num_processes = num_processes
         self._actor = Actor(target)
         self._pool: Optional[List[ObjectRef]] = None
+        self._finished = False  # Cached once all processes are observed to exit
 
     @property
     def num_processes(self) -> int:
@@ -56,9 +132,14 @@ class MPool:
         return self._num_processes
 
     def is_running(self) -> bool:
-        """Return whether the ``start`` method has already been called"""
+        """Return whether any processes started by the ``start`` method are still running"""
 
-        return self._pool is not None and not any(remote.future().done() or remote.future().cancelled() for remote in self._pool)
+        if self._pool is None or self._finished:
+            return False
+
+        _, running = ray.wait(self._pool, num_returns=len(self._pool), timeout=0, fetch_local=False)
+        self._finished = not running
+        return bool(running)
 
     def start(self) -> None:
         """Start all processes asynchronously"""
@@ -66,7 +147,8 @@ class MPool:
         if self.is_running():
             raise RuntimeError('Pool was already started once before')
 
-        self._pool = [self._actor.act() for _ in range(self._num_processes)]
+        self._finished = False
+        self._pool = self._actor.act_many(self._num_processes)
 
     def join(self) -> None:
         """Wait for any running pool processes to finish running before continuing execution"""
@@ -74,6 +156,11 @@ class MPool:
         for remote in self._pool:
             ray.get(remote)
 
+    def wait(self) -> None:
+        """Wait for all pool processes to exit, including any processes that exit with an error"""
+
+        ray.wait(self._pool, num_returns=len(self._pool))
+
     def kill(self) -> None:
         """Kill all running processes without trying to exit gracefully"""
 
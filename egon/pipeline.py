@@ -11,20 +11,22 @@ import os
 import warnings
 from copy import copy
 from inspect import getmembers
-from itertools import chain
+from itertools import chain, cycle
+from threading import Thread
 from typing import List, Tuple
 
 import ray
 
 from . import connectors as conn
 from . import nodes
+from .parallel import cpus_by_cache
 from .visualize import Visualizer
 
 
 class Pipeline:
     """Manages a collection of nodes as a single analysis pipeline"""
 
-    def __init__(self, address: str = None) -> None:
+    def __init__(self, address: str = None, pin_cpus: bool = False) -> None:
         """Base class for a data analysis pipeline constructed of multiple interconnected nodes
 
         The pipeline will run on a single machine by default and will
@@ -34,9 +36,11 @@ class Pipeline:
 
         Args:
             address: Optionally specify the address of the ray cluster to run on
+            pin_cpus: Pin the processes of each node to CPUs on the local machine (Linux only)
         """
 
         self.address = address
+        self.pin_cpus = pin_cpus
 
         # Store the nodes and connectors used to build the pipeline
         # so they can be exposed by public accessors
@@ -45,6 +49,7 @@ class Pipeline:
         self._sources: List[nodes.Source] = []
         self._inlines: List[nodes.Node] = []
         self._targets: List[nodes.Target] = []
+        self._watchers: List[Thread] = []  # Threads running ``_notify_when_upstream_done``
 
         for attr_name, *_ in getmembers(self, lambda a: isinstance(a, nodes.AbstractNode)):
             node = getattr(self, attr_name)
@@ -101,6 +106,27 @@ class Pipeline:
         for node in chain(*self.nodes):
             node._pool.terminate()
 
+    def close(self) -> None:
+        """Release the queues held by the pipeline's input connectors
+
+        Closing a pipeline is only safe once all pipeline processes have
+        exited. Closed pipelines cannot be run again.
+        """
+
+        for connector in self._inputs:
+            connector.close()
+
+    def _assign_cpus(self) -> None:
+        """Assign CPUs to each node round-robin in the order data flows through the pipeline
+
+        Neighboring nodes are assigned neighboring CPUs, which are ordered to
+        share an L3 cache where possible.
+        """
+
+        cpus = cycle(cpus_by_cache())
+        for node in chain(*self.nodes):
+            node.cpu_affinity = {next(cpus) for _ in range(node.num_processes)}
+
     def run(self) -> None:
         """Start all pipeline processes and block execution until all processes exit"""
 
@@ -113,13 +139,48 @@ class Pipeline:
         for node in chain(*self.nodes):
             node._pool.join()
 
+        for watcher in self._watchers:
+            watcher.join()
+
+        self._watchers.clear()
+
     def run_async(self) -> None:
         """Start all processes asynchronously"""
 
         ray.init(address=self.address, ignore_reinit_error=True)
+        if self.pin_cpus:
+            self._assign_cpus()
+
+        for connector in self._outputs:
+            connector.finalize()
+
+        for connector in self._inputs:
+            connector._clear_upstream_done()
+
         for node in chain(*self.nodes):
             node._pool.start()
 
+        for connector in self._inputs:
+            watcher = Thread(target=self._notify_when_upstream_done, args=(connector,), daemon=True)
+            watcher.start()
+            self._watchers.append(watcher)
+
+    @staticmethod
+    def _notify_when_upstream_done(connector: conn.Input) -> None:
+        """Block until all nodes upstream of a connector exit and then notify the connector
+
+        The connector is not notified if its parent node has already exited.
+
+        Args:
+            connector: The input connector to notify
+        """
+
+        for partner in connector.partners:
+            partner.parent_node._pool.wait()
+
+        if connector.parent_node._pool.is_running():
+            connector._notify_upstream_done()
+
     def visualize(
             self,
             host: str = os.getenv("EGON_HOST", "127.0.0.1"),
@@ -0,0 +1,264 @@
+"""Ray backed queues used by ``Input`` connectors to buffer data between
+nodes running in separate processes.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+import ray
+from ray.util.queue import Empty
+from ray.util.queue import Full
+
+from .utils import UpstreamDoneSignal
+
+
+def _validate_timeout(timeout: Optional[float]) -> None:
+    """Raise an error if the given timeout is negative"""
+
+    if timeout is not None and timeout < 0:
+        raise ValueError("'timeout' must be a non-negative number")
+
+
+class _QueueActor:
+    """Ray actor holding the items stored in a ``BatchQueue``"""
+
+    def __init__(self, maxsize: int = 0) -> None:
+        self.maxsize = maxsize
+        self.items: Deque = deque()
+        self.num_signals = 0  # Pending ``UpstreamDoneSignal`` objects are tracked separately from data
+        self._condition: Optional[asyncio.Condition] = None
+
+    @property
+    def condition(self) -> asyncio.Condition:
+        """Condition notified whenever items are added to or removed from the queue"""
+
+        # Created lazily so the condition is bound to the actor's event loop
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+
+        return self._condition
+
+    async def _wait_for(self, predicate: Callable[[], Any], timeout: Optional[float], exception: type) -> None:
+        """Wait for ``predicate`` to evaluate as true while holding ``self.condition``
+
+        Raises:
+            ``exception``: If the predicate is not satisfied within the given timeout
+        """
+
+        try:
+            await asyncio.wait_for(self.condition.wait_for(predicate), timeout)
+
+        except asyncio.TimeoutError:
+            raise exception
+
+    def qsize(self) -> int:
+        return len(self.items)
+
+    def empty(self) -> bool:
+        return not self.items
+
+    def full(self) -> bool:
+        return 0 < self.maxsize <= len(self.items)
+
+    async def put(self, item: Any, timeout: Optional[float] = None) -> None:
+        async with self.condition:
+            await self._wait_for(lambda: not self.full(), timeout, Full)
+            self.items.append(item)
+            self.condition.notify_all()
+
+    async def put_nowait_batch(self, items: List) -> None:
+        async with self.condition:
+            if 0 < self.maxsize < len(self.items) + len(items):
+                raise Full(f'Cannot add {len(items)} items to a queue of size {len(self.items)}')
+
+            self.items.extend(items)
+            self.condition.notify_all()
+
+    async def restore_batch(self, items: List) -> None:
+        async with self.condition:
+            self.items.extendleft(reversed(items))
+            self.condition.notify_all()
+
+    async def add_signals(self, num_signals: int) -> None:
+        async with self.condition:
+            self.num_signals += num_signals
+            self.condition.notify_all()
+
+    def clear_signals(self) -> None:
+        self.num_signals = 0
+
+    async def get_batch(self, max_items: int, num_consumers: int = 1, timeout: Optional[float] = None) -> List:
+        async with self.condition:
+            await self._wait_for(lambda: self.items or self.num_signals, timeout, Empty)
+
+            # Signals are only returned once all data has been retrieved
+            if not self.items:
+                self.num_signals -= 1
+                return [UpstreamDoneSignal]
+
+            # Pending items are divided evenly between consumers so one consumer does not starve the others
+            fair_share = -(-len(self.items) // num_consumers)
+            batch = [self.items.popleft() for _ in range(min(max_items, fair_share))]
+            self.condition.notify_all()
+            return batch
+
+
+_RemoteQueueActor = ray.remote(_QueueActor)
+
+
+class BatchQueue:
+    """First-in, first-out queue shared between processes via a ray actor
+
+    Unlike ``ray.util.queue.Queue``, multiple items can be retrieved
+    from the queue in a single remote call. The queue also tracks signals
+    indicating upstream nodes have exited without counting them as data.
+    """
+
+    def __init__(self, maxsize: int = 0, actor_options: Optional[Dict] = None) -> None:
+        """First-in, first-out queue shared between processes via a ray actor
+
+        Args:
+            maxsize: Maximum number of items in the queue (``0`` for unlimited)
+            actor_options: Options passed to the underlying ray actor
+        """
+
+        self.maxsize = maxsize
+        self.actor = _RemoteQueueActor.options(**(actor_options or {})).remote(maxsize)
+
+    def __len__(self) -> int:
+        return self.qsize()
+
+    def qsize(self) -> int:
+        """Return the number of items in the queue"""
+
+        return ray.get(self.actor.qsize.remote())
+
+    def empty(self) -> bool:
+        """Return whether the queue is empty"""
+
+        return ray.get(self.actor.empty.remote())
+
+    async def empty_async(self) -> bool:
+        """Coroutine version of ``empty``"""
+
+        return await self.actor.empty.remote()
+
+    def full(self) -> bool:
+        """Return whether the queue is full"""
+
+        return ray.get(self.actor.full.remote())
+
+    def put(self, item: Any, timeout: Optional[float] = None) -> None:
+        """Add an item to the queue, blocking until space is available
+
+        Args:
+            item: The item to add
+            timeout: Seconds to wait for space in the queue before raising an error
+
+        Raises:
+            Full: If no space is available within the given timeout
+        """
+
+        _validate_timeout(timeout)
+        ray.get(self.actor.put.remote(item, timeout))
+
+    async def put_async(self, item: Any, timeout: Optional[float] = None) -> None:
+        """Coroutine version of ``put``
+
+        Raises:
+            Full: If no space is available within the given timeout
+        """
+
+        _validate_timeout(timeout)
+        await self.actor.put.remote(item, timeout)
+
+    def put_nowait_batch(self, items: List) -> None:
+        """Add multiple items to the queue without blocking
+
+        Args:
+            items: The items to add
+
+        Raises:
+            Full: If the items will not fit in the queue
+        """
+
+        ray.get(self.actor.put_nowait_batch.remote(list(items)))
+
+    def restore_batch(self, items: List) -> None:
+        """Return previously retrieved items to the front of the queue
+
+        Restored items are added regardless of the maximum queue size
+        and are retrieved again in their original order.
+
+        Args:
+            items: The items to restore
+        """
+
+        ray.get(self.actor.restore_batch.remote(list(items)))
+
+    def add_signals(self, num_signals: int) -> None:
+        """Queue ``UpstreamDoneSignal`` objects behind all current and future data
+
+        Signals are not counted towards the size of the queue and are only
+        retrieved once the queue is empty.
+
+        Args:
+            num_signals: The number of signals to add
+        """
+
+        ray.get(self.actor.add_signals.remote(num_signals))
+
+    def clear_signals(self) -> None:
+        """Discard any pending ``UpstreamDoneSignal`` objects"""
+
+        ray.get(self.actor.clear_signals.remote())
+
+    def get(self, timeout: Optional[float] = None) -> Any:
+        """Remove and return the next item from the queue
+
+        Args:
+            timeout: Seconds to wait for an item before raising an error
+
+        Raises:
+            Empty: If no item is available within the given timeout
+        """
+
+        return self.get_batch(1, timeout=timeout)[0]
+
+    def get_batch(self, max_items: int, num_consumers: int = 1, timeout: Optional[float] = None) -> List:
+        """Retrieve between one and ``max_items`` items from the queue
+
+        Args:
+            max_items: The maximum number of items to retrieve
+            num_consumers: Number of consumers sharing the pending items
+            timeout: Seconds to wait for an item before raising an error
+
+        Raises:
+            Empty: If no items are retrieved within the given timeout
+        """
+
+        _validate_timeout(timeout)
+        return ray.get(self.actor.get_batch.remote(max_items, num_consumers, timeout))
+
+    async def get_batch_async(
+            self, max_items: int, num_consumers: int = 1, timeout: Optional[float] = None
+    ) -> List:
+        """Coroutine version of ``get_batch``
+
+        Raises:
+            Empty: If no items are retrieved within the given timeout
+        """
+
+        _validate_timeout(timeout)
+        return await self.actor.get_batch.remote(max_items, num_consumers, timeout)
+
+    def shutdown(self) -> None:
+        """Terminate the underlying actor"""
+
+        if self.actor is not None:
+            ray.kill(self.actor, no_restart=True)
+
+        self.actor = None
@@ -7,6 +7,10 @@ class KillSignal:
     """Used to indicate that a process should exit"""
 
 
+class UpstreamDoneSignal:
+    """Used to indicate that all nodes upstream of a connector have exited"""
+
+
 class ObjectCollection:
     """Collection of objects with O(1) add and remove"""
 
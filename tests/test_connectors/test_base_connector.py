@@ -1,5 +1,6 @@
 """Tests for the ``BaseConnector`` class"""
 
+import pickle
 from unittest import TestCase
 
 from egon.connectors import BaseConnector
@@ -23,3 +24,26 @@ class DefaultState(TestCase):
         """Test connectors are marked as disconnected by default"""
 
         self.assertFalse(BaseConnector().is_connected())
+
+
+class StringRepresentation(TestCase):
+    """Test the string representation of connector instances"""
+
+    def test_includes_name(self) -> None:
+        """Test the connector name is included in the string representation"""
+
+        connector = BaseConnector(name='test_name')
+        self.assertEqual(f'<BaseConnector(name=test_name) object at {hex(id(connector))}>', str(connector))
+
+    def test_updates_with_name(self) -> None:
+        """Test the string representation is updated when the connector is renamed"""
+
+        connector = BaseConnector(name='test_name')
+        connector.name = 'new_name'
+        self.assertIn('(name=new_name)', str(connector))
+
+    def test_updates_after_unpickling(self) -> None:
+        """Test the string representation uses the address of an unpickled copy"""
+
+        connector = pickle.loads(pickle.dumps(BaseConnector(name='test_name')))
+        self.assertEqual(f'<BaseConnector(name=test_name) object at {hex(id(connector))}>', str(connector))
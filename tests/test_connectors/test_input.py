@@ -5,7 +5,7 @@ from unittest import TestCase
 
 from egon.connectors import Input, KillSignal
 from egon.exceptions import MissingConnectionError
-from egon.mock import MockTarget
+from egon.mock import MockSource, MockTarget
 
 
 class InputGet(TestCase):
@@ -45,6 +45,49 @@ class InputGet(TestCase):
         self.assertFalse(target.is_expecting_data())
         self.assertIs(target.input.get(timeout=15), KillSignal)
 
+    def test_kill_signal_on_upstream_done_signal(self) -> None:
+        """Test a kill signal is returned without waiting on the refresh interval once upstream nodes exit"""
+
+        source = MockSource()
+        target = MockTarget()
+        source.output.connect(target.input)
+        source.set_running_state(True)
+
+        target.input._queue.put('test_val')
+        target.input._notify_upstream_done()
+
+        self.assertEqual('test_val', target.input.get(timeout=15, refresh_interval=15))
+        start = time.time()
+        self.assertIs(target.input.get(timeout=15, refresh_interval=15), KillSignal)
+        self.assertLess(time.time() - start, 15)
+
+
+class Prefetch(TestCase):
+    """Test the prefetching of pending queue items into a local buffer"""
+
+    def setUp(self) -> None:
+        self.connector = Input(prefetch=5)
+        self.test_vals = list(range(10))
+        self.connector._queue.put_nowait_batch(self.test_vals)
+
+    def test_error_on_non_positive_prefetch(self) -> None:
+        """Test a ValueError is raised when ``prefetch`` is not a positive number"""
+
+        with self.assertRaises(ValueError):
+            Input(prefetch=0)
+
+    def test_values_returned_in_order(self) -> None:
+        """Test prefetched values are returned in the same order they were queued"""
+
+        self.assertListEqual(self.test_vals, [self.connector.get(timeout=15) for _ in self.test_vals])
+
+    def test_buffer_limited_by_prefetch(self) -> None:
+        """Test no more than ``prefetch`` items are retrieved from the queue at once"""
+
+        self.connector.get(timeout=15)
+        self.assertEqual(4, len(self.connector._buffer))
+        self.assertEqual(9, self.connector.size())
+
 
 class InputIterGet(TestCase):
     """Test iteration behavior of the ``iter_get`` method"""
@@ -80,6 +123,13 @@ class InputIterGet(TestCase):
 
         self.assertEqual(next(self.input_connector.iter_get()), test_val)
 
+    def test_returns_all_queued_values(self) -> None:
+        """Test the iterator returns all queued values before exiting"""
+
+        test_vals = list(range(100))
+        self.input_connector._queue.put_nowait_batch(test_vals)
+        self.assertListEqual(test_vals, list(self.input_connector.iter_get()))
+
 
 class MaxSize(TestCase):
     """Tests the setting/getting of the maximum size for the underlying queue"""
@@ -143,3 +193,39 @@ class QueueProperties(TestCase):
         time.sleep(1)
 
         self.assertFalse(self.connector.is_empty())
+
+
+class RefreshInterval(TestCase):
+    """Test the validation of the default refresh interval"""
+
+    def test_set_at_init(self) -> None:
+        """Test the refresh interval is set at __init__"""
+
+        self.assertEqual(5, Input(refresh_interval=5).refresh_interval)
+
+    def test_error_on_non_positive_refresh(self) -> None:
+        """Test a ValueError is raised when the refresh interval is not a positive number"""
+
+        with self.assertRaises(ValueError):
+            Input(refresh_interval=0)
+
+        with self.assertRaises(ValueError):
+            Input().refresh_interval = -1
+
+
+class Close(TestCase):
+    """Test the release of the underlying queue by the ``close`` method"""
+
+    def test_queue_actor_released(self) -> None:
+        """Test the actor backing the underlying queue is shut down"""
+
+        connector = Input()
+        connector.close()
+        self.assertIsNone(connector._queue.actor)
+
+    def test_repeat_close_is_allowed(self) -> None:
+        """Test closing an already closed connector does not raise an error"""
+
+        connector = Input()
+        connector.close()
+        connector.close()
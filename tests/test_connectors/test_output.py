@@ -35,6 +35,97 @@ class DataPut(TestCase):
         Output().put(5, raise_missing_connection=False)
 
 
+class DataPutMany(TestCase):
+    """Test batched data routing by ``Output`` instances"""
+
+    def setUp(self) -> None:
+        self.output = Output()
+        self.input = Input()
+        self.output.connect(self.input)
+
+    def test_stores_values_in_queue(self) -> None:
+        """Test values are stored in the connected queue in the order they are given"""
+
+        test_vals = list(range(10))
+        self.output.put_many(test_vals, batch_size=3)
+        self.assertListEqual(test_vals, [self.input._queue.get() for _ in test_vals])
+
+    def test_error_on_non_positive_batch_size(self) -> None:
+        """Test a ValueError is raised when ``batch_size`` is not a positive number"""
+
+        with self.assertRaises(ValueError):
+            self.output.put_many([1, 2, 3], batch_size=0)
+
+    def test_error_if_unconnected(self) -> None:
+        """Test ``put_many`` raises an error if the output is not connected"""
+
+        with self.assertRaises(MissingConnectionError):
+            Output().put_many([1, 2, 3])
+
+    @staticmethod
+    def test_no_error_if_unconnected_and_empty() -> None:
+        """Test ``put_many`` does not raise an error for an unconnected output when there is no data to send"""
+
+        Output().put_many([])
+
+
+class ZeroCopy(TestCase):
+    """Test data routing through the object store by ``Output`` instances"""
+
+    def setUp(self) -> None:
+        self.output = Output(zero_copy=True)
+        self.input = Input()
+        self.output.connect(self.input)
+
+    def test_put_values_returned_by_input(self) -> None:
+        """Test values sent via ``put`` are returned as their original value"""
+
+        self.output.put('test_val')
+        self.assertEqual('test_val', self.input.get(timeout=15))
+
+    def test_put_many_values_returned_by_input(self) -> None:
+        """Test values sent via ``put_many`` are returned as their original value"""
+
+        test_vals = [1, 2, 3]
+        self.output.put_many(test_vals)
+        self.assertListEqual(test_vals, [self.input.get(timeout=15) for _ in test_vals])
+
+
+class Finalize(TestCase):
+    """Test the specialization of the ``put`` method by ``finalize``"""
+
+    def setUp(self) -> None:
+        self.output = Output()
+        self.inputs = [Input(), Input()]
+        for input_connector in self.inputs:
+            self.output.connect(input_connector)
+
+        self.output.finalize()
+
+    def test_stores_value_in_all_queues(self) -> None:
+        """Test the specialized ``put`` method puts data into every connected queue"""
+
+        self.output.put('test_val')
+        for input_connector in self.inputs:
+            self.assertEqual('test_val', input_connector._queue.get())
+
+    def test_connection_restores_generic_put(self) -> None:
+        """Test changing the connections restores the generic ``put`` method"""
+
+        self.output.disconnect(self.inputs[0])
+        self.assertNotIn('put', self.output.__dict__)
+
+    def test_error_if_unconnected(self) -> None:
+        """Test the specialized ``put`` raises an error if the output is not connected"""
+
+        output = Output()
+        output.finalize()
+        with self.assertRaises(MissingConnectionError):
+            output.put(5)
+
+        output.put(5, raise_missing_connection=False)
+
+
 class InstanceConnect(TestCase):
     """Test the connection of generic connector objects to other"""
 
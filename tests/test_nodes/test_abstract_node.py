@@ -1,12 +1,14 @@
 """Tests for the class based construction of pipeline nodes."""
 
+import os
+import pickle
 from functools import partial
 from time import sleep
-from unittest import TestCase
+from unittest import TestCase, skipUnless
 
 from egon import mock
 from egon.exceptions import MissingConnectionError
-from egon.mock import MockSource
+from egon.mock import MockSource, MockTarget
 
 
 class Execution(TestCase):
@@ -29,6 +31,52 @@ class Execution(TestCase):
         self.node.execute()
         self.assertListEqual(self.call_list, ['setup', 'action', 'teardown'])
 
+    @staticmethod
+    def test_unconnected_source_without_data() -> None:
+        """Test executing an unconnected source with no data to send does not raise an error"""
+
+        MockSource().execute()
+
+    def test_unread_data_restored_on_exit(self) -> None:
+        """Test data prefetched but not read by a node process is returned to the input queue"""
+
+        target = MockTarget()
+        target.input._queue.put_nowait_batch(list(range(10)))
+
+        # Mimic a node process that reads a single item and exits early
+        process_copy = pickle.loads(pickle.dumps(target))
+        process_copy.action = lambda: process_copy.input.get(timeout=15)
+        process_copy.execute()
+
+        self.assertEqual(9, target.input.size())
+        self.assertEqual(1, target.input.get(timeout=15))
+
+
+@skipUnless(hasattr(os, 'sched_setaffinity'), 'Setting CPU affinity is not supported on this platform')
+class CpuAffinity(TestCase):
+    """Test node processes are pinned to the assigned CPUs during execution"""
+
+    def setUp(self) -> None:
+        self.original_cpus = os.sched_getaffinity(0)
+        self.node = mock.MockNode()
+        self.node.cpu_affinity = {min(self.original_cpus)}
+
+        # Track the CPU affinity while the node is executing
+        self.action_cpus = []
+        self.node.action = lambda: self.action_cpus.append(os.sched_getaffinity(0))
+
+    def test_pinned_during_execution(self) -> None:
+        """Test the process is pinned to the assigned CPUs while executing"""
+
+        self.node.execute()
+        self.assertEqual([self.node.cpu_affinity], self.action_cpus)
+
+    def test_restored_after_execution(self) -> None:
+        """Test the original CPU affinity is restored after executing"""
+
+        self.node.execute()
+        self.assertEqual(self.original_cpus, os.sched_getaffinity(0))
+
 
 class TreeNavigation(TestCase):
     """Test ``Node`` instances are aware of their neighbors"""
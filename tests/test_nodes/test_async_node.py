@@ -0,0 +1,97 @@
+"""Tests for the ``AsyncNode`` class"""
+
+import asyncio
+from unittest import TestCase
+
+from egon.connectors import Input, Output
+from egon.mock import MockSource, MockTarget
+from egon.nodes import AsyncNode
+
+
+class AsyncPassThrough(AsyncNode):
+    """Coroutine node that forwards input data to its output"""
+
+    def __init__(self, num_coroutines: int = 1) -> None:
+        self.input = Input()
+        self.output = Output()
+        super().__init__(num_coroutines=num_coroutines)
+
+    async def action(self) -> None:
+        async for x in self.input.iter_get_async():
+            await self.output.put_async(x)
+
+
+class WorkerCount(TestCase):
+    """Test the number of workers reported by coroutine nodes"""
+
+    def test_includes_coroutines(self) -> None:
+        """Test the number of workers accounts for coroutines in every process"""
+
+        node = AsyncPassThrough(num_coroutines=3)
+        node.num_processes = 2
+        self.assertEqual(6, node.num_workers)
+
+    def test_error_on_non_positive_coroutines(self) -> None:
+        """Test a ``ValueError`` is raised when ``num_coroutines`` is not a positive number"""
+
+        with self.assertRaises(ValueError):
+            AsyncPassThrough(num_coroutines=0)
+
+
+class Execution(TestCase):
+    """Test the execution of ``action`` coroutines"""
+
+    def runTest(self) -> None:
+        """Test all input data is forwarded by concurrent coroutines"""
+
+        test_data = list(range(10))
+        source = MockSource(test_data)
+        node = AsyncPassThrough(num_coroutines=3)
+        target = MockTarget()
+
+        source.output.connect(node.input)
+        node.output.connect(target.input)
+
+        source.execute()
+        node.execute()
+        target.execute()
+        self.assertCountEqual(test_data, target.accumulated_data)
+
+
+class UpstreamDone(TestCase):
+    """Test concurrent coroutines exit on upstream done signals without losing data"""
+
+    def runTest(self) -> None:
+        """Test all queued data is forwarded before coroutines exit"""
+
+        test_data = list(range(100))
+        source = MockSource(test_data)
+        node = AsyncPassThrough(num_coroutines=4)
+        node.input._prefetch = 7
+        target = MockTarget()
+
+        source.output.connect(node.input)
+        node.output.connect(target.input)
+
+        # Upstream remains "running" so coroutines can only exit via the signals
+        source.execute()
+        source.set_running_state(True)
+        node.input._notify_upstream_done()
+        node.execute()
+
+        target.execute()
+        self.assertCountEqual(test_data, target.accumulated_data)
+
+
+class ZeroCopyGet(TestCase):
+    """Test coroutines retrieve data routed through the object store"""
+
+    def runTest(self) -> None:
+        """Test ``get_async`` returns the original value"""
+
+        output = Output(zero_copy=True)
+        input_connector = Input()
+        output.connect(input_connector)
+
+        output.put('test_val')
+        self.assertEqual('test_val', asyncio.run(input_connector.get_async(timeout=15)))
@@ -29,3 +29,24 @@ class ProcessAllocation(TestCase):
 
         with self.assertRaises(ValueError):
             MPool(-1, target_func)
+
+
+class RunningState(TestCase):
+    """Test the pool tracks whether its processes are running"""
+
+    def setUp(self) -> None:
+        self.pool = MPool(2, target_func)
+
+    def test_not_running_before_start(self) -> None:
+        """Test the pool is not running before it is started"""
+
+        self.assertFalse(self.pool.is_running())
+
+    def test_running_until_joined(self) -> None:
+        """Test the pool is running after start and not running once joined"""
+
+        self.pool.start()
+        self.assertTrue(self.pool.is_running())
+
+        self.pool.join()
+        self.assertFalse(self.pool.is_running())
@@ -58,9 +58,7 @@ class TestPipelineThroughput(TestCase):
         # Run should populate the global queue
         AddingPipeline().run()
 
-        # Convert the queue into a list
-        as_list = []
-        while GLOBAL_QUEUE.qsize() != 0:
-            as_list.append(GLOBAL_QUEUE.get())
+        # Drain the queue into a list with a single queue operation
+        as_list = GLOBAL_QUEUE.get_nowait_batch(GLOBAL_QUEUE.qsize())
 
         self.assertCountEqual(TESTING_VALS, as_list)
@@ -1,10 +1,13 @@
 """Tests for the ``Pipeline`` class"""
 
+from itertools import chain
 from unittest import TestCase
 
+from egon.connectors import Input
+from egon.decorators import as_source
 from egon.exceptions import MissingConnectionError, OrphanedNodeError
 from egon.mock import MockNode, MockSource, MockTarget
-from egon.nodes import Node
+from egon.nodes import Node, Target
 from egon.pipeline import Pipeline
 
 
@@ -21,6 +24,35 @@ class SimplePipeline(Pipeline):
         super(SimplePipeline, self).__init__()
 
 
+@as_source
+def empty_source() -> None:
+    """A source node that exits without sending any data"""
+
+    yield from ()
+
+
+class IdleTarget(Target):
+    """A target node that exits without reading from its input"""
+
+    def __init__(self) -> None:
+        self.input = Input()
+        super(IdleTarget, self).__init__()
+
+    def action(self) -> None:
+        """Exit without reading any data"""
+
+
+class IdlePipeline(Pipeline):
+    """Pipeline whose target exits without waiting on upstream nodes"""
+
+    def __init__(self) -> None:
+        self.source = empty_source
+        self.target = IdleTarget()
+
+        self.source.output.connect(self.target.input)
+        super(IdlePipeline, self).__init__()
+
+
 class ProcessDiscovery(TestCase):
     """Test the pipeline is aware of all processes forked by it's nodes"""
 
@@ -69,6 +101,60 @@ class ConnectorDiscovery(TestCase):
         self.assertCountEqual(expected_outputs, pipeline.connectors[1])
 
 
+class CpuAssignment(TestCase):
+    """Test the assignment of CPUs to pipeline nodes"""
+
+    def runTest(self) -> None:
+        """Test every node is assigned one CPU per process"""
+
+        pipeline = SimplePipeline()
+        pipeline._assign_cpus()
+        for node in chain(*pipeline.nodes):
+            self.assertTrue(node.cpu_affinity)
+            self.assertLessEqual(len(node.cpu_affinity), node.num_processes)
+
+
+class PipelineClose(TestCase):
+    """Test closing a pipeline releases the queues of all its connectors"""
+
+    def runTest(self) -> None:
+        """Test the queue actor of every input connector is shut down"""
+
+        pipeline = SimplePipeline()
+        pipeline.close()
+
+        inputs, _ = pipeline.connectors
+        for connector in inputs:
+            self.assertIsNone(connector._queue.actor)
+
+
+class PipelineExit(TestCase):
+    """Test the state of pipeline nodes once the pipeline finishes running"""
+
+    def setUp(self) -> None:
+        self.pipeline = IdlePipeline()
+
+    def tearDown(self) -> None:
+        self.pipeline.close()
+
+    def test_not_expecting_data(self) -> None:
+        """Test no node is expecting data after the pipeline exits"""
+
+        self.pipeline.run()
+        for node in chain(*self.pipeline.nodes):
+            self.assertFalse(node.is_expecting_data())
+
+    def test_watcher_threads_joined(self) -> None:
+        """Test threads notifying connectors of upstream exits are finished once the pipeline exits"""
+
+        self.pipeline.run_async()
+        watchers = list(self.pipeline._watchers)
+        self.pipeline.wait_for_exit()
+
+        self.assertTrue(watchers)
+        self.assertFalse(any(watcher.is_alive() for watcher in watchers))
+
+
 class PipelineValidation(TestCase):
     """Test appropriate errors are raised for an invalid pipeline."""
 
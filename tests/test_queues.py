@@ -0,0 +1,116 @@
+"""Tests for the ``egon.queues`` module."""
+
+from unittest import TestCase
+
+from ray.util.queue import Empty, Full
+
+from egon.queues import BatchQueue
+from egon.utils import UpstreamDoneSignal
+
+
+class BatchRetrieval(TestCase):
+    """Test the retrieval of data from a ``BatchQueue``"""
+
+    def setUp(self) -> None:
+        self.queue = BatchQueue()
+
+    def tearDown(self) -> None:
+        self.queue.shutdown()
+
+    def test_items_returned_in_order(self) -> None:
+        """Test items are retrieved in the same order they were added"""
+
+        test_vals = list(range(10))
+        self.queue.put_nowait_batch(test_vals)
+        self.assertListEqual(test_vals, self.queue.get_batch(len(test_vals)))
+
+    def test_batch_limited_by_max_items(self) -> None:
+        """Test no more than ``max_items`` items are retrieved"""
+
+        self.queue.put_nowait_batch(range(10))
+        self.assertListEqual([0, 1, 2], self.queue.get_batch(3))
+        self.assertEqual(7, self.queue.qsize())
+
+    def test_batch_limited_by_fair_share(self) -> None:
+        """Test pending items are divided evenly between consumers"""
+
+        self.queue.put_nowait_batch(range(10))
+        self.assertEqual(4, len(self.queue.get_batch(10, num_consumers=3)))
+
+    def test_empty_raised_on_timeout(self) -> None:
+        """Test an ``Empty`` error is raised when no data is available"""
+
+        with self.assertRaises(Empty):
+            self.queue.get_batch(1, timeout=0.1)
+
+    def test_negative_timeout_error(self) -> None:
+        """Test a ``ValueError`` is raised for negative timeouts"""
+
+        with self.assertRaises(ValueError):
+            self.queue.get_batch(1, timeout=-1)
+
+
+class MaxSize(TestCase):
+    """Test inserting data into a ``BatchQueue`` with a maximum size"""
+
+    def setUp(self) -> None:
+        self.queue = BatchQueue(maxsize=2)
+
+    def tearDown(self) -> None:
+        self.queue.shutdown()
+
+    def test_full_raised_on_put_timeout(self) -> None:
+        """Test ``Full`` is raised when a put times out on a full queue"""
+
+        self.queue.put_nowait_batch([1, 2])
+        self.assertTrue(self.queue.full())
+        with self.assertRaises(Full):
+            self.queue.put(3, timeout=0.1)
+
+    def test_full_raised_for_oversized_batch(self) -> None:
+        """Test ``Full`` is raised when a batch does not fit in the queue"""
+
+        with self.assertRaises(Full):
+            self.queue.put_nowait_batch([1, 2, 3])
+
+        self.assertTrue(self.queue.empty())
+
+    def test_restore_ignores_maxsize(self) -> None:
+        """Test restored items are returned to the front of a full queue"""
+
+        self.queue.put_nowait_batch([3, 4])
+        self.queue.restore_batch([1, 2])
+        self.assertListEqual([1, 2, 3, 4], self.queue.get_batch(4))
+
+
+class UpstreamSignals(TestCase):
+    """Test the tracking of upstream done signals by a ``BatchQueue``"""
+
+    def setUp(self) -> None:
+        self.queue = BatchQueue()
+
+    def tearDown(self) -> None:
+        self.queue.shutdown()
+
+    def test_signals_not_counted_as_data(self) -> None:
+        """Test signals do not count towards the queue size"""
+
+        self.queue.add_signals(2)
+        self.assertTrue(self.queue.empty())
+        self.assertEqual(0, self.queue.qsize())
+
+    def test_signals_returned_after_data(self) -> None:
+        """Test a signal is only returned once all pending data is retrieved"""
+
+        self.queue.add_signals(1)
+        self.queue.put_nowait_batch([1, 2])
+        self.assertListEqual([1, 2], self.queue.get_batch(10))
+        self.assertListEqual([UpstreamDoneSignal], self.queue.get_batch(10))
+
+    def test_cleared_signals_not_returned(self) -> None:
+        """Test cleared signals are no longer retrieved from the queue"""
+
+        self.queue.add_signals(1)
+        self.queue.clear_signals()
+        with self.assertRaises(Empty):
+            self.queue.get_batch(1, timeout=0.1)